@@ -3,6 +3,7 @@ import torch.nn.functional as F
 from scipy.stats import special_ortho_group
 
 from libtilt.fsc import fsc
+from libtilt.grids import central_slice_grid
 from libtilt.projection.project_fourier import project_fourier
 from libtilt.backprojection.backproject_fourier import backproject_fourier
 
@@ -50,3 +51,15 @@ def test_projection_backprojection_cycle_rfft():
     print(_fsc)
     assert torch.all(_fsc[:7] > 0.989)
     assert torch.all(_fsc[7:] > 0.995)
+
+
+def test_projection_backprojection_cycle_reuses_central_slice_grid():
+    volume = torch.rand((16, 16, 16))
+    rotations = torch.eye(3).reshape(1, 3, 3)
+
+    # projection and backprojection request different grids, both stay cached
+    central_slice_grid.cache_clear()
+    projections = project_fourier(volume, rotation_matrices=rotations)
+    backproject_fourier(images=projections, rotation_matrices=rotations)
+    project_fourier(volume, rotation_matrices=rotations)
+    assert central_slice_grid.cache_info().hits > 0
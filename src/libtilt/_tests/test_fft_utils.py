@@ -13,9 +13,10 @@ from libtilt.fft_utils import (
     fftfreq_to_spatial_frequency,
     spatial_frequency_to_fftfreq,
     fftfreq_to_dft_coordinates,
+    distance_from_dc_for_dft,
 )
 from libtilt.grids.fftfreq_grid import _construct_fftfreq_grid_2d
-from libtilt.pytest_utils import device_test
+from libtilt.pytest_utils import device_test, AVAILABLE_DEVICES
 
 
 # seed the random number generator to ensure tests are consistent
@@ -83,7 +84,7 @@ def test_rfft_to_symmetrised_dft_3d():
 
 @pytest.mark.parametrize(
     "inplace",
-    [(True,), (False,)]
+    [True, False]
 )
 @device_test
 def test_symmetrised_dft_to_dft_2d(inplace: bool):
@@ -98,7 +99,7 @@ def test_symmetrised_dft_to_dft_2d(inplace: bool):
 
 @pytest.mark.parametrize(
     "inplace",
-    [(True,), (False,)]
+    [True, False]
 )
 @device_test
 def test_symmetrised_dft_to_dft_2d_batched(inplace: bool):
@@ -113,7 +114,7 @@ def test_symmetrised_dft_to_dft_2d_batched(inplace: bool):
 
 @pytest.mark.parametrize(
     "inplace",
-    [(True,), (False,)]
+    [True, False]
 )
 @device_test
 def test_symmetrised_dft_to_rfft_2d(inplace: bool):
@@ -127,7 +128,7 @@ def test_symmetrised_dft_to_rfft_2d(inplace: bool):
 
 @pytest.mark.parametrize(
     "inplace",
-    [(True,), (False,)]
+    [True, False]
 )
 @device_test
 def test_symmetrised_dft_to_dft_2d_batched(inplace: bool):
@@ -142,7 +143,7 @@ def test_symmetrised_dft_to_dft_2d_batched(inplace: bool):
 
 @pytest.mark.parametrize(
     "inplace",
-    [(True,), (False,)]
+    [True, False]
 )
 @device_test
 def test_symmetrised_dft_to_dft_3d(inplace: bool):
@@ -159,7 +160,7 @@ def test_symmetrised_dft_to_dft_3d(inplace: bool):
 
 @pytest.mark.parametrize(
     "inplace",
-    [(True,), (False,)]
+    [True, False]
 )
 @device_test
 def test_symmetrised_dft_to_dft_3d_batched(inplace: bool):
@@ -173,6 +174,18 @@ def test_symmetrised_dft_to_dft_3d_batched(inplace: bool):
     assert torch.allclose(desymmetrised_dft, fft, atol=1e-5)
 
 
+@pytest.mark.parametrize(
+    "shape",
+    [(10, 10, 10), (2, 7, 7, 7)]
+)
+@device_test
+def test_symmetrised_dft_to_dft_3d_out_of_place_matches_inplace(shape):
+    symmetrised_dft = torch.rand(shape, dtype=torch.complex64)
+    expected = _symmetrised_dft_to_dft_3d(symmetrised_dft.clone(), inplace=True)
+    result = _symmetrised_dft_to_dft_3d(symmetrised_dft, inplace=False)
+    assert torch.equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "fftshifted, rfft, input, expected",
     [
@@ -233,4 +246,23 @@ def test_fftfreq_to_dft_coords():
     k = fftfreq_grid(image_shape=(10, 10), rfft=False, fftshift=True)
     result = fftfreq_to_dft_coordinates(frequencies=k, image_shape=(10, 10), rfft=False)
     expected = coordinate_grid(image_shape=(10, 10))
-    assert torch.allclose(result, expected)
\ No newline at end of file
+    assert torch.allclose(result, expected)
+
+
+@pytest.mark.parametrize("device", AVAILABLE_DEVICES)
+@pytest.mark.parametrize(
+    "fftshifted, rfft",
+    [(False, False), (False, True), (True, False), (True, True)],
+)
+def test_distance_from_dc_for_dft(fftshifted, rfft, device):
+    from libtilt.grids import fftfreq_grid
+
+    dft_shape = rfft_shape((6, 6)) if rfft is True else (6, 6)
+    result = distance_from_dc_for_dft(
+        dft_shape, rfft=rfft, fftshifted=fftshifted, device=device
+    )
+    assert result.device.type == torch.device(device).type
+    k = fftfreq_grid(
+        image_shape=(6, 6), rfft=rfft, fftshift=fftshifted, norm=True, device=device
+    )
+    assert torch.allclose(result, k * 6)
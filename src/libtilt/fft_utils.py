@@ -3,7 +3,6 @@ from typing import Sequence, Tuple
 from itertools import combinations, permutations
 
 import einops
-import numpy as np
 import torch
 from torch.nn import functional as F
 
@@ -146,18 +145,16 @@ def _rfft_to_symmetrised_dft_2d(rfft: torch.Tensor) -> torch.Tensor:
         `rfft`.
     """
     r = rfft.shape[-2]  # lenght of h is unmodified by rfft
-    if rfft.ndim == 2:
-        output = torch.zeros((r + 1, r + 1), dtype=torch.complex64)
-    elif rfft.ndim == 3:
-        b = rfft.shape[0]
-        output = torch.zeros((b, r + 1, r + 1), dtype=torch.complex64)
-    # fftshift full length dims to center DC component
+    output = torch.empty(
+        (*rfft.shape[:-2], r + 1, r + 1), dtype=rfft.dtype, device=rfft.device
+    )
+    # place rfft in output, writing halves of h swapped to fftshift in one pass
     dc = r // 2
-    rfft = torch.fft.fftshift(rfft, dim=(-2,))
-    output[..., :-1, dc:] = rfft  # place rfft in output
-    output[..., -1, dc:] = rfft[..., 0, :]  # replicate components at Nyquist
+    output[..., :dc, dc:] = rfft[..., dc:, :]
+    output[..., dc:-1, dc:] = rfft[..., :dc, :]
+    output[..., -1, dc:] = output[..., 0, dc:]  # replicate components at Nyquist
     # fill redundant half
-    output[..., :, :dc] = torch.flip(torch.conj(output[..., :, dc + 1:]), dims=(-2, -1))
+    output[..., :, :dc] = torch.flip(output[..., :, dc + 1:], dims=(-2, -1)).conj()
     return output
 
 
@@ -177,24 +174,23 @@ def _rfft_to_symmetrised_dft_3d(dft: torch.Tensor) -> torch.Tensor:
     - symmetrised fftfreq: `[-0.5000, -0.3333, -0.1667,  0.0000,  0.1667,  0.3333,  0.5000]`
     """
     r = dft.shape[-3]  # input dim length
-    if dft.ndim == 3:
-        output = torch.zeros((r + 1, r + 1, r + 1), dtype=torch.complex64)
-    elif dft.ndim == 4:
-        b = dft.shape[0]
-        output = torch.zeros((b, r + 1, r + 1, r + 1), dtype=torch.complex64)
-    # fftshift full length dims (i.e. not -1) to center DC component
-    dft = torch.fft.fftshift(dft, dim=(-3, -2))
-    # place rfft in output
+    output = torch.empty(
+        (*dft.shape[:-3], r + 1, r + 1, r + 1), dtype=dft.dtype, device=dft.device
+    )
+    # place rfft in output, writing halves of full length dims (i.e. not -1)
+    # swapped to fftshift without an intermediate copy
     dc = r // 2  # index for DC component
-    output[..., :-1, :-1, dc:] = dft
+    output[..., :dc, :dc, dc:] = dft[..., dc:, dc:, :]
+    output[..., :dc, dc:-1, dc:] = dft[..., dc:, :dc, :]
+    output[..., dc:-1, :dc, dc:] = dft[..., :dc, dc:, :]
+    output[..., dc:-1, dc:-1, dc:] = dft[..., :dc, :dc, :]
     # replicate components at nyquist (symmetrise)
-    output[..., :-1, -1, dc:] = dft[..., :, 0, :]
-    output[..., -1, :-1, dc:] = dft[..., 0, :, :]
-    output[..., -1, -1, dc:] = dft[..., 0, 0, :]
+    output[..., -1, :-1, dc:] = output[..., 0, :-1, dc:]
+    output[..., :, -1, dc:] = output[..., :, 0, dc:]
     # fill redundant half-spectrum
     output[..., :, :, :dc] = torch.flip(
-        torch.conj(output[..., :, :, dc + 1:]), dims=(-3, -2, -1)
-    )
+        output[..., :, :, dc + 1:], dims=(-3, -2, -1)
+    ).conj()
     return output
 
 
@@ -221,9 +217,23 @@ def _symmetrised_dft_to_dft_2d(dft: torch.Tensor, inplace: bool = True):
 
     """
     if inplace is False:
-        dft = dft.clone()
-    dft[..., :, 0] = (0.5 * dft[..., :, 0]) + (0.5 * dft[..., :, -1])
-    dft[..., 0, :] = (0.5 * dft[..., 0, :]) + (0.5 * dft[..., -1, :])
+        # only copy the desymmetrised region, nyquist components are averaged
+        # from the input directly into the output
+        h, w = dft.shape[-2:]
+        output = torch.empty(
+            (*dft.shape[:-2], h - 1, w - 1), dtype=dft.dtype, device=dft.device
+        )
+        output.copy_(dft[..., :-1, :-1])
+        column = torch.mul(dft[..., :, 0], 0.5)  # (..., h)
+        column.add_(dft[..., :, -1], alpha=0.5)
+        output[..., :, 0] = column[..., :-1]
+        output[..., 0, :].mul_(0.5).add_(dft[..., -1, :-1], alpha=0.5)
+        output[..., 0, 0] = torch.mul(column[..., 0], 0.5).add_(
+            column[..., -1], alpha=0.5
+        )
+        return output
+    dft[..., :, 0].mul_(0.5).add_(dft[..., :, -1], alpha=0.5)
+    dft[..., 0, :].mul_(0.5).add_(dft[..., -1, :], alpha=0.5)
     return dft[..., :-1, :-1]
 
 
@@ -235,10 +245,11 @@ def symmetrised_dft_to_rfft_2d(dft: torch.Tensor, inplace: bool = True):
     r = dc + 1  # start of right half-spectrum
     rfft = dft if inplace is True else torch.clone(dft)
     # average hermitian symmetric halves
-    rfft[..., :, r:] *= 0.5
-    rfft[..., :, r:] += 0.5 * torch.flip(torch.conj(rfft[..., :, :dc]), dims=(-2, -1))
+    rfft[..., :, r:].mul_(0.5).add_(
+        torch.flip(torch.conj(rfft[..., :, :dc]), dims=(-2, -1)), alpha=0.5
+    )
     # average leftover redundant nyquist
-    rfft[..., 0, r:] = (0.5 * rfft[..., 0, r:]) + (0.5 * rfft[..., -1, r:])
+    rfft[..., 0, r:].mul_(0.5).add_(rfft[..., -1, r:], alpha=0.5)
     # return without redundant nyquist
     rfft = rfft[..., :-1, dc:]
     return torch.fft.ifftshift(rfft, dim=-2)
@@ -267,10 +278,28 @@ def _symmetrised_dft_to_dft_3d(dft: torch.Tensor, inplace: bool = True):
 
     """
     if inplace is False:
-        dft = dft.clone()
-    dft[..., :, :, 0] = (0.5 * dft[..., :, :, 0]) + (0.5 * dft[..., :, :, -1])
-    dft[..., :, 0, :] = (0.5 * dft[..., :, 0, :]) + (0.5 * dft[..., :, -1, :])
-    dft[..., 0, :, :] = (0.5 * dft[..., 0, :, :]) + (0.5 * dft[..., -1, :, :])
+        # only copy the desymmetrised region, each face at nyquist is averaged
+        # along its own axis then desymmetrised as a 2D DFT
+        # faces are written d, h, w so edges shared between faces end up
+        # averaged in the same order as the in place path
+        d, h, w = dft.shape[-3:]
+        output = torch.empty(
+            (*dft.shape[:-3], d - 1, h - 1, w - 1), dtype=dft.dtype, device=dft.device
+        )
+        output.copy_(dft[..., :-1, :-1, :-1])
+        output[..., 0, :, :] = _symmetrised_dft_to_dft_2d(
+            torch.mul(dft[..., 0, :, :], 0.5).add_(dft[..., -1, :, :], alpha=0.5)
+        )
+        output[..., :, 0, :] = _symmetrised_dft_to_dft_2d(
+            torch.mul(dft[..., :, 0, :], 0.5).add_(dft[..., :, -1, :], alpha=0.5)
+        )
+        output[..., :, :, 0] = _symmetrised_dft_to_dft_2d(
+            torch.mul(dft[..., :, :, 0], 0.5).add_(dft[..., :, :, -1], alpha=0.5)
+        )
+        return output
+    dft[..., :, :, 0].mul_(0.5).add_(dft[..., :, :, -1], alpha=0.5)
+    dft[..., :, 0, :].mul_(0.5).add_(dft[..., :, -1, :], alpha=0.5)
+    dft[..., 0, :, :].mul_(0.5).add_(dft[..., -1, :, :], alpha=0.5)
     return dft[..., :-1, :-1, :-1]
 
 
@@ -316,56 +345,76 @@ def dft_to_rfft_3d(
     return dft
 
 
+def _array_indices(
+    shape: Sequence[int], device: torch.device | None = None
+) -> torch.Tensor:
+    """`(*shape, ndim)` array of indices into an array, like `np.indices`."""
+    indices = [torch.arange(length, device=device) for length in shape]
+    return torch.stack(torch.meshgrid(*indices, indexing='ij'), dim=-1)
+
+
 def _indices_centered_on_dc_for_shifted_rfft(
-    rfft_shape: Sequence[int]
+    rfft_shape: Sequence[int], device: torch.device | None = None
 ) -> torch.Tensor:
-    rfft_shape = torch.tensor(rfft_shape)
+    rfft_indices = _array_indices(rfft_shape, device=device)  # ((d), h, w, c)
+    rfft_shape = torch.tensor(rfft_shape, device=device)
     rfftn_dc_idx = torch.div(rfft_shape, 2, rounding_mode='floor')
     rfftn_dc_idx[-1] = 0
-    rfft_indices = torch.tensor(np.indices(rfft_shape))  # (c, (d), h, w)
-    rfft_indices = einops.rearrange(rfft_indices, 'c ... -> ... c')
     return rfft_indices - rfftn_dc_idx
 
 
-def _distance_from_dc_for_shifted_rfft(rfft_shape: Sequence[int]) -> torch.Tensor:
-    centered_indices = _indices_centered_on_dc_for_shifted_rfft(rfft_shape)
+def _distance_from_dc_for_shifted_rfft(
+    rfft_shape: Sequence[int], device: torch.device | None = None
+) -> torch.Tensor:
+    centered_indices = _indices_centered_on_dc_for_shifted_rfft(
+        rfft_shape, device=device
+    )
     return einops.reduce(centered_indices ** 2, '... c -> ...', reduction='sum') ** 0.5
 
 
 def _indices_centered_on_dc_for_shifted_dft(
-    dft_shape: Sequence[int], rfft: bool
+    dft_shape: Sequence[int], rfft: bool, device: torch.device | None = None
 ) -> torch.Tensor:
     if rfft is True:
-        return _indices_centered_on_dc_for_shifted_rfft(dft_shape)
-    dft_indices = torch.tensor(np.indices(dft_shape)).float()
-    dft_indices = einops.rearrange(dft_indices, 'c ... -> ... c')
-    dc_idx = dft_center(dft_shape, fftshifted=True, rfft=False)
+        return _indices_centered_on_dc_for_shifted_rfft(dft_shape, device=device)
+    dft_indices = _array_indices(dft_shape, device=device).float()  # (..., c)
+    dc_idx = dft_center(dft_shape, fftshifted=True, rfft=False, device=device)
     return dft_indices - dc_idx
 
 
 def _distance_from_dc_for_shifted_dft(
-    dft_shape: Sequence[int], rfft: bool
+    dft_shape: Sequence[int], rfft: bool, device: torch.device | None = None
 ) -> torch.Tensor:
-    idx = _indices_centered_on_dc_for_shifted_dft(dft_shape, rfft=rfft)
+    idx = _indices_centered_on_dc_for_shifted_dft(dft_shape, rfft=rfft, device=device)
     return einops.reduce(idx ** 2, '... c -> ...', reduction='sum') ** 0.5
 
 
 def indices_centered_on_dc_for_dft(
-    dft_shape: Sequence[int], rfft: bool, fftshifted: bool
+    dft_shape: Sequence[int],
+    rfft: bool,
+    fftshifted: bool,
+    device: torch.device | None = None,
 ) -> torch.Tensor:
-    dft_indices = _indices_centered_on_dc_for_shifted_dft(dft_shape, rfft=rfft)
-    dft_indices = einops.rearrange(dft_indices, '... c -> c ...')
+    dft_indices = _indices_centered_on_dc_for_shifted_dft(
+        dft_shape, rfft=rfft, device=device
+    )
     if fftshifted is False:
-        dims_to_shift = tuple(torch.arange(start=-1 * len(dft_shape), end=0, step=1))
+        # spatial dims precede the trailing coordinate dim
+        dims_to_shift = tuple(range(-1 * len(dft_shape) - 1, -1))
         dims_to_shift = dims_to_shift[:-1] if rfft is True else dims_to_shift
         dft_indices = torch.fft.ifftshift(dft_indices, dim=dims_to_shift)
-    return einops.rearrange(dft_indices, 'c ... -> ... c')
+    return dft_indices
 
 
 def distance_from_dc_for_dft(
-    dft_shape: Sequence[int], rfft: bool, fftshifted: bool
+    dft_shape: Sequence[int],
+    rfft: bool,
+    fftshifted: bool,
+    device: torch.device | None = None,
 ) -> torch.Tensor:
-    idx = indices_centered_on_dc_for_dft(dft_shape, rfft=rfft, fftshifted=fftshifted)
+    idx = indices_centered_on_dc_for_dft(
+        dft_shape, rfft=rfft, fftshifted=fftshifted, device=device
+    )
     return einops.reduce(idx ** 2, '... c -> ...', reduction='sum') ** 0.5
 
 
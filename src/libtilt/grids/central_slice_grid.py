@@ -1,3 +1,5 @@
+import functools
+
 import einops
 import torch
 
@@ -5,17 +7,20 @@ from libtilt.grids.fftfreq_grid import _construct_fftfreq_grid_2d
 from libtilt.fft_utils import rfft_shape, fftshift_2d
 
 
+@functools.lru_cache(maxsize=32)
 def central_slice_grid(
     image_shape: tuple[int, int, int],
     rfft: bool,
     fftshift: bool = False,
     device: torch.device | None = None,
+    dtype: torch.dtype | None = None,
 ) -> torch.Tensor:
     h, w = image_shape[-2:]
     slice_hw = _construct_fftfreq_grid_2d(
         image_shape=(h, w),
         rfft=rfft,
-        device=device
+        device=device,
+        dtype=dtype,
     )  # (h, w, 2)
     if rfft is True:
         h, w = rfft_shape((h, w))
@@ -36,18 +41,15 @@ def rotated_central_slice_grid(
     fftshift: bool = False,
     device: torch.device | None = None,
 ):
+    if rotation_matrix_zyx is False:
+        # xyz -> zyx on the (..., 3, 3) matrices rather than the grid
+        rotation_matrices = torch.flip(rotation_matrices, dims=(-2, -1))
     grid = central_slice_grid(
         image_shape=image_shape,
         rfft=rfft,
         fftshift=fftshift,
         device=device,
+        dtype=rotation_matrices.dtype,
     )  # (h, w, 3)
-    if rotation_matrix_zyx is False:
-        grid = torch.flip(grid, dims=(-1,))
-    rotation_matrices = einops.rearrange(rotation_matrices, '... i j -> ... 1 1 i j')
-    grid = einops.rearrange(grid, 'h w coords -> h w coords 1')
-    grid = rotation_matrices @ grid
-    grid = einops.rearrange(grid, '... h w coords 1 -> ... h w coords')
-    if rotation_matrix_zyx is False:  # back to zyx if currently xyz
-        grid = torch.flip(grid, dims=(-1,))
+    grid = torch.einsum('...ij,hwj->...hwi', rotation_matrices, grid)
     return grid
@@ -4,7 +4,7 @@ from typing import Sequence, Tuple
 import einops
 import torch
 
-from libtilt.fft_utils import rfft_shape, fftshift_2d, fftshift_3d
+from libtilt.fft_utils import fftshift_2d, fftshift_3d
 
 
 @functools.lru_cache(maxsize=1)
@@ -15,6 +15,7 @@ def fftfreq_grid(
     spacing: float | tuple[float, float] | tuple[float, float, float] = 1,
     norm: bool = False,
     device: torch.device | None = None,
+    dtype: torch.dtype | None = None,
 ):
     """Construct a 2D or 3D grid of DFT sample frequencies.
 
@@ -38,6 +39,8 @@ def fftfreq_grid(
         Whether to compute the Euclidean norm over the last dimension.
     device: torch.device | None
         PyTorch device on which the returned grid will be stored.
+    dtype: torch.dtype | None
+        Floating point dtype of the returned grid, the torch default if `None`.
 
     Returns
     -------
@@ -51,6 +54,7 @@ def fftfreq_grid(
             rfft=rfft,
             spacing=spacing,
             device=device,
+            dtype=dtype,
         )
         if fftshift is True:
             frequency_grid = einops.rearrange(frequency_grid, '... freq -> freq ...')
@@ -62,6 +66,7 @@ def fftfreq_grid(
             rfft=rfft,
             spacing=spacing,
             device=device,
+            dtype=dtype,
         )
         if fftshift is True:
             frequency_grid = einops.rearrange(frequency_grid, '... freq -> freq ...')
@@ -83,7 +88,8 @@ def _construct_fftfreq_grid_2d(
     image_shape: Tuple[int, int],
     rfft: bool,
     spacing: float | tuple[float, float] = 1,
-    device: torch.device = None
+    device: torch.device = None,
+    dtype: torch.dtype | None = None,
 ) -> torch.Tensor:
     """Construct a grid of DFT sample freqs for a 2D image.
 
@@ -98,6 +104,8 @@ def _construct_fftfreq_grid_2d(
         Sample spacing in `h` and `w` dimensions of the grid.
     device: torch.device
         Torch device for the resulting grid.
+    dtype: torch.dtype | None
+        Floating point dtype for the resulting grid.
 
     Returns
     -------
@@ -109,19 +117,19 @@ def _construct_fftfreq_grid_2d(
     dh, dw = spacing if isinstance(spacing, Sequence) else [spacing] * 2
     last_axis_frequency_func = torch.fft.rfftfreq if rfft is True else torch.fft.fftfreq
     h, w = image_shape
-    freq_y = torch.fft.fftfreq(h, d=dh, device=device)
-    freq_x = last_axis_frequency_func(w, d=dw, device=device)
-    h, w = rfft_shape(image_shape) if rfft is True else image_shape
-    freq_yy = einops.repeat(freq_y, 'h -> h w', w=w)
-    freq_xx = einops.repeat(freq_x, 'w -> h w', h=h)
-    return einops.rearrange([freq_yy, freq_xx], 'freq h w -> h w freq')
+    freq_y = torch.fft.fftfreq(h, d=dh, device=device, dtype=dtype)
+    freq_x = last_axis_frequency_func(w, d=dw, device=device, dtype=dtype)
+    # meshgrid returns broadcast views, stack writes the grid in a single pass
+    freq_yy, freq_xx = torch.meshgrid(freq_y, freq_x, indexing='ij')
+    return torch.stack([freq_yy, freq_xx], dim=-1)
 
 
 def _construct_fftfreq_grid_3d(
     image_shape: Sequence[int],
     rfft: bool,
     spacing: float | Tuple[float, float, float] = 1,
-    device: torch.device = None
+    device: torch.device = None,
+    dtype: torch.dtype | None = None,
 ) -> torch.Tensor:
     """Construct a grid of DFT sample freqs for a 3D image.
 
@@ -136,6 +144,8 @@ def _construct_fftfreq_grid_3d(
         Sample spacing in `d`, `h` and `w` dimensions of the grid.
     device: torch.device
         Torch device for the resulting grid.
+    dtype: torch.dtype | None
+        Floating point dtype for the resulting grid.
 
     Returns
     -------
@@ -147,11 +157,9 @@ def _construct_fftfreq_grid_3d(
     dd, dh, dw = spacing if isinstance(spacing, Sequence) else [spacing] * 3
     last_axis_frequency_func = torch.fft.rfftfreq if rfft is True else torch.fft.fftfreq
     d, h, w = image_shape
-    freq_z = torch.fft.fftfreq(d, d=dd, device=device)
-    freq_y = torch.fft.fftfreq(h, d=dh, device=device)
-    freq_x = last_axis_frequency_func(w, d=dw, device=device)
-    d, h, w = rfft_shape(image_shape) if rfft is True else image_shape
-    freq_zz = einops.repeat(freq_z, 'd -> d h w', h=h, w=w)
-    freq_yy = einops.repeat(freq_y, 'h -> d h w', d=d, w=w)
-    freq_xx = einops.repeat(freq_x, 'w -> d h w', d=d, h=h)
-    return einops.rearrange([freq_zz, freq_yy, freq_xx], 'freq ... -> ... freq')
+    freq_z = torch.fft.fftfreq(d, d=dd, device=device, dtype=dtype)
+    freq_y = torch.fft.fftfreq(h, d=dh, device=device, dtype=dtype)
+    freq_x = last_axis_frequency_func(w, d=dw, device=device, dtype=dtype)
+    # meshgrid returns broadcast views, stack writes the grid in a single pass
+    freq_zz, freq_yy, freq_xx = torch.meshgrid(freq_z, freq_y, freq_x, indexing='ij')
+    return torch.stack([freq_zz, freq_yy, freq_xx], dim=-1)
@@ -13,11 +13,13 @@ def sample_dft_3d(
 ) -> torch.Tensor:
     """Sample a complex volume with linear interpolation.
 
+    A stack of volumes can be passed, each volume is sampled at every coordinate
+    in a single call to `torch.nn.functional.grid_sample`.
 
     Parameters
     ----------
     dft: torch.Tensor
-        `(d, h, w)` complex valued volume.
+        `(d, h, w)` complex valued volume or `(..., d, h, w)` stack of volumes.
     coordinates: torch.Tensor
         `(..., zyx)` array of coordinates at which `dft` should be sampled.
         Coordinates should be ordered zyx, aligned with image dimensions `(d, h, w)`.
@@ -26,31 +28,41 @@ def sample_dft_3d(
     Returns
     -------
     samples: torch.Tensor
-        `(..., )` array of complex valued samples from `dft`.
+        `(..., )` array of complex valued samples from `dft`. For a stack of
+        volumes the stack dimensions precede the coordinate dimensions.
     """
-    coordinates, ps = einops.pack([coordinates], pattern='* zyx')
-    n_samples = coordinates.shape[0]
+    output_shape = (*dft.shape[:-3], *coordinates.shape[:-1])
+    dft = dft.reshape(-1, *dft.shape[-3:])  # a view, einops.pack would copy
+    coordinates, _ = einops.pack([coordinates], pattern='* zyx')
+    n_volumes = dft.shape[0]
 
     # cannot sample complex tensors directly with grid_sample
     # c.f. https://github.com/pytorch/pytorch/issues/67634
     # workaround: treat real and imaginary parts as separate channels
-    dft = einops.rearrange(torch.view_as_real(dft), 'd h w complex -> complex d h w')
-    dft = einops.repeat(dft, 'complex d h w -> b complex d h w', b=n_samples)
-    coordinates = einops.rearrange(coordinates, 'b zyx -> b 1 1 1 zyx')  # b d h w zyx
+    # this is a strided view, grid_sample reads it without copying the volume
+    dft = einops.rearrange(
+        torch.view_as_real(dft), 'n d h w complex -> n complex d h w'
+    )
+
+    # sample all points from each volume rather than repeating volumes once
+    # per sample, points are laid out along the depth dimension of the grid
+    # the grid is converted once then expanded (stride 0) across the stack
+    coordinates = einops.rearrange(coordinates, 'b zyx -> 1 b 1 1 zyx')  # n d h w zyx
+    grid = array_to_grid_sample(coordinates, array_shape=dft.shape[-3:])
+    grid = grid.expand(n_volumes, -1, -1, -1, -1)
 
     samples = F.grid_sample(
         input=dft,
-        grid=array_to_grid_sample(coordinates, array_shape=dft.shape[-3:]),
+        grid=grid,
         mode='bilinear',  # this is trilinear when input is volumetric
         padding_mode='border',  # this increases sampling fidelity at nyquist
         align_corners=True,
     )
-    samples = einops.rearrange(samples, 'b complex 1 1 1 -> b complex')
-    samples = torch.view_as_complex(samples.contiguous())  # (b, )
+    samples = einops.rearrange(samples, 'n complex b 1 1 -> complex n b')
+    samples = torch.complex(real=samples[0], imag=samples[1])  # (n, b)
 
-    # pack data back up and return
-    [samples] = einops.unpack(samples, pattern='*', packed_shapes=ps)
-    return samples  # (...)
+    # restore stack and coordinate dimensions and return
+    return samples.reshape(output_shape)  # (...)
 
 
 def insert_into_dft_3d(
@@ -1,2 +1,2 @@
-from .project_fourier import project_fourier
+from .project_fourier import project_fourier, FourierProjector
 from .project_real import project_volume_real, project_image_real
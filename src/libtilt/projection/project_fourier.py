@@ -18,7 +18,7 @@ def project_fourier(
     Parameters
     ----------
     volume: torch.Tensor
-        `(d, d, d)` volume.
+        `(d, d, d)` volume or `(..., d, d, d)` stack of volumes.
     rotation_matrices: torch.Tensor
         `(..., 3, 3)` array of matrices which rotate coordinates of the
         central slice to be sampled.
@@ -31,45 +31,109 @@ def project_fourier(
     Returns
     -------
     projections: torch.Tensor
-        `(..., d, d)` array of projection images.
+        `(..., d, d)` array of projection images. For a stack of volumes the
+        stack dimensions precede the dimensions of `rotation_matrices`.
     """
-    # padding
-    if pad is True:
-        pad_length = volume.shape[-1] // 2
+    projector = FourierProjector(volume, pad=pad)
+    return projector(rotation_matrices, rotation_matrix_zyx=rotation_matrix_zyx)
+
+
+class FourierProjector:
+    """Project a cubic volume from its precomputed DFT.
+
+    The padded, sinc2 corrected DFT of the volume is calculated once on
+    construction so repeated projection of the same volume only samples
+    central slices and transforms them back to real space.
+
+    Parameters
+    ----------
+    volume: torch.Tensor
+        `(d, d, d)` volume or `(..., d, d, d)` stack of volumes.
+    pad: bool
+        Whether to pad the volume with zeros to increase sampling in the DFT.
+    """
+
+    def __init__(self, volume: torch.Tensor, pad: bool = True):
+        self.pad_length = volume.shape[-1] // 2 if pad is True else 0
+        self.image_shape = tuple(
+            length + 2 * self.pad_length for length in volume.shape[-3:]
+        )
+        self.dtype = torch.promote_types(volume.dtype, torch.get_default_dtype())
+        self.dft = _volume_to_centered_rfft(volume, pad_length=self.pad_length)
+
+    def __call__(
+        self,
+        rotation_matrices: torch.Tensor,
+        rotation_matrix_zyx: bool = False,
+    ) -> torch.Tensor:
+        """Make projections of the volume.
+
+        Parameters
+        ----------
+        rotation_matrices: torch.Tensor
+            `(..., 3, 3)` array of matrices which rotate coordinates of the
+            central slice to be sampled.
+        rotation_matrix_zyx: bool
+            Whether rotation matrices apply to zyx (`True`) or xyz (`False`)
+            coordinates.
+
+        Returns
+        -------
+        projections: torch.Tensor
+            `(..., d, d)` array of projection images.
+        """
+        # keep rotated grids in the working precision of the volume
+        rotation_matrices = rotation_matrices.to(self.dtype)
+
+        # make projections by taking central slices
+        projections = extract_central_slices_rfft(
+            dft=self.dft,
+            image_shape=self.image_shape,
+            rotation_matrices=rotation_matrices,
+            rotation_matrix_zyx=rotation_matrix_zyx,
+            fftshift=False,
+        )  # (..., h, w) rfft, sampled in non-fftshifted order
+        return _rfft_slices_to_projections(projections, pad_length=self.pad_length)
+
+
+def _volume_to_centered_rfft(volume: torch.Tensor, pad_length: int) -> torch.Tensor:
+    """Pad, premultiply by sinc2 and compute the fftshifted rfft of a volume."""
+    # work in floating point, integer volumes cannot hold the sinc2 correction
+    volume = volume.to(torch.promote_types(volume.dtype, torch.get_default_dtype()))
+    if pad_length > 0:
         volume = F.pad(volume, pad=[pad_length] * 6, mode='constant', value=0)
 
-    # premultiply by sinc2
+    # volume center to array origin, this makes a copy we can safely modify in place
+    volume = torch.fft.fftshift(volume, dim=(-3, -2, -1))
+
+    # premultiply by sinc2, grid is not fftshifted to match the shifted volume
     grid = fftfreq_grid(
-        image_shape=volume.shape,
+        image_shape=volume.shape[-3:],
         rfft=False,
-        fftshift=True,
+        fftshift=False,
         norm=True,
-        device=volume.device
+        device=volume.device,
+        dtype=volume.dtype,
     )
-    volume = volume * torch.sinc(grid) ** 2
+    volume *= torch.sinc(grid).square_()
 
     # calculate DFT
-    dft = torch.fft.fftshift(volume, dim=(-3, -2, -1))  # volume center to array origin
-    dft = torch.fft.rfftn(dft, dim=(-3, -2, -1))
+    dft = torch.fft.rfftn(volume, dim=(-3, -2, -1))
     dft = torch.fft.fftshift(dft, dim=(-3, -2,))  # actual fftshift of rfft
+    return dft
 
-    # make projections by taking central slices
-    projections = extract_central_slices_rfft(
-        dft=dft,
-        image_shape=volume.shape,
-        rotation_matrices=rotation_matrices,
-        rotation_matrix_zyx=rotation_matrix_zyx
-    )  # (..., h, w) rfft
 
-    # transform back to real space
-    projections = torch.fft.ifftshift(projections, dim=(-2,))  # ifftshift of rfft
+def _rfft_slices_to_projections(
+    projections: torch.Tensor, pad_length: int
+) -> torch.Tensor:
+    """Transform non-fftshifted rfft slices into real space projection images."""
     projections = torch.fft.irfftn(projections, dim=(-2, -1))
     projections = torch.fft.ifftshift(projections, dim=(-2, -1))  # recenter real space
 
     # unpad
-    if pad is True:
+    if pad_length > 0:
         projections = projections[..., pad_length:-pad_length, pad_length:-pad_length]
-    return torch.real(projections)
+    return projections
 
 
 def extract_central_slices_rfft(
@@ -77,8 +141,13 @@ def extract_central_slices_rfft(
     image_shape: tuple[int, int, int],
     rotation_matrices: torch.Tensor,
     rotation_matrix_zyx: bool,
+    fftshift: bool = True,
 ):
-    """Extract central slice from an fftshifted rfft."""
+    """Extract central slice from an fftshifted rfft.
+
+    If `fftshift` is `False` the slices are sampled directly in the layout
+    of a non-fftshifted rfft, ready for `torch.fft.irfftn`.
+    """
     # generate grid of DFT sample frequencies for a central slice in the xy-plane
     # these are a coordinate grid for the DFT
     grid = rotated_central_slice_grid(
@@ -86,15 +155,14 @@ def extract_central_slices_rfft(
         rotation_matrices=rotation_matrices,
         rotation_matrix_zyx=rotation_matrix_zyx,
         rfft=True,
-        fftshift=True,
+        fftshift=fftshift,
         device=dft.device,
     )  # (..., h, w, 3)
 
     # flip coordinates in redundant half transform
-    conjugate_mask = grid[..., 2] < 0
-    conjugate_mask = einops.repeat(conjugate_mask, '... -> ... 3')
-    grid[conjugate_mask] *= -1
-    conjugate_mask = conjugate_mask[..., 0]  # un-repeat
+    # a dense sign multiplier avoids boolean-indexed scatters
+    sign = torch.where(grid[..., 2] < 0, -1, 1).to(grid.dtype)  # (..., h, w)
+    grid = grid * einops.rearrange(sign, '... -> ... 1')
 
     # convert frequencies to array coordinates and sample from DFT
     grid = fftfreq_to_dft_coordinates(
@@ -105,5 +173,5 @@ def extract_central_slices_rfft(
     projections = sample_dft_3d(dft=dft, coordinates=grid)  # (..., h, w) rfft
 
     # take complex conjugate of values from redundant half transform
-    projections[conjugate_mask] = torch.conj(projections[conjugate_mask])
+    projections = torch.complex(projections.real, projections.imag * sign)
     return projections
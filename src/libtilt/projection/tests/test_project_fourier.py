@@ -1,7 +1,7 @@
 import torch
 from scipy.spatial.transform import Rotation as R
 
-from libtilt.projection.project_fourier import project_fourier
+from libtilt.projection.project_fourier import project_fourier, FourierProjector
 from libtilt.pytest_utils import device_test
 
 
@@ -28,3 +28,56 @@ def test_project_with_rotation():
     projection = project_fourier(volume, rotation_matrix)
     expected = torch.sum(volume, dim=0)
     assert torch.allclose(projection, expected, atol=1e-3)
+
+
+@device_test
+def test_project_double_precision():
+    volume = torch.zeros((10, 10, 10), dtype=torch.float64)
+    volume[5, 5, 5] = 1
+
+    # rotation matrices are cast to the dtype of the volume
+    rotation_matrix = torch.eye(3).reshape(1, 3, 3)
+    projection = project_fourier(volume, rotation_matrix)
+    expected = torch.sum(volume, dim=0)
+    assert projection.dtype == torch.float64
+    assert torch.allclose(projection, expected)
+
+
+@device_test
+def test_project_stack_of_volumes():
+    volumes = torch.rand((2, 10, 10, 10))
+
+    # each volume is projected with every rotation
+    rotation_matrices = torch.tensor(R.random(num=3).as_matrix()).float()
+    projections = project_fourier(volumes, rotation_matrices)
+    assert projections.shape == (2, 3, 10, 10)
+    for volume, volume_projections in zip(volumes, projections):
+        expected = project_fourier(volume, rotation_matrices)
+        assert torch.allclose(volume_projections, expected, atol=1e-6)
+
+
+@device_test
+def test_fourier_projector():
+    volume = torch.zeros((10, 10, 10))
+    volume[5, 5, 5] = 1
+
+    # projector reuses its DFT across calls
+    projector = FourierProjector(volume)
+    rotation_matrix = torch.eye(3).reshape(1, 3, 3)
+    expected = torch.sum(volume, dim=0)
+    for _ in range(2):
+        projections = projector(rotation_matrix)
+        assert projections.shape == (1, 10, 10)
+        assert torch.allclose(projections, expected, atol=1e-6)
+
+
+def test_project_integer_volume():
+    volume = torch.zeros((10, 10, 10), dtype=torch.int64)
+    volume[5, 5, 5] = 1
+
+    # integer volumes are projected in the default floating point dtype
+    rotation_matrix = torch.eye(3).reshape(1, 3, 3)
+    projection = project_fourier(volume, rotation_matrix)
+    expected = torch.sum(volume, dim=0).float()
+    assert projection.dtype == torch.get_default_dtype()
+    assert torch.allclose(projection, expected, atol=1e-6)
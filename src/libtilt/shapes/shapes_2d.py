@@ -25,8 +25,7 @@ def circle(
         norm=True,
         device=device,
     )
-    mask = torch.zeros_like(distances, dtype=torch.bool)
-    mask[distances < radius] = 1
+    mask = distances < radius
     return add_soft_edge_2d(mask, smoothing_radius=smoothing_radius)
 
 
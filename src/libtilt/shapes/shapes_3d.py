@@ -24,8 +24,7 @@ def sphere(
         norm=True,
         device=device,
     )
-    mask = torch.zeros_like(distances, dtype=torch.bool)
-    mask[distances < radius] = 1
+    mask = distances < radius
     return add_soft_edge_3d(mask, smoothing_radius=smoothing_radius)
 
 
@@ -46,12 +45,10 @@ def cuboid(
         device=device,
     )
     dd, dh, dw = dimensions[0] / 2, dimensions[1] / 2, dimensions[2] / 2
-    depth_mask = torch.logical_and(coordinates[..., 0] > -dh, coordinates[..., 0] < dh)
-    height_mask = torch.logical_and(coordinates[..., 1] > -dw, coordinates[..., 1] < dw)
+    depth_mask = torch.logical_and(coordinates[..., 0] > -dd, coordinates[..., 0] < dd)
+    height_mask = torch.logical_and(coordinates[..., 1] > -dh, coordinates[..., 1] < dh)
     width_mask = torch.logical_and(coordinates[..., 2] > -dw, coordinates[..., 2] < dw)
-    mask = einops.rearrange([depth_mask, height_mask, width_mask],
-                            'dhw d h w -> d h w dhw')
-    mask = torch.all(mask, dim=-1)
+    mask = depth_mask & height_mask & width_mask
     return add_soft_edge_3d(mask, smoothing_radius=smoothing_radius)
 
 
@@ -0,0 +1,15 @@
+import torch
+
+from libtilt.shapes.shapes_3d import cuboid
+from libtilt.pytest_utils import device_test
+
+
+@device_test
+def test_cuboid():
+    mask = cuboid(dimensions=(4, 8, 12), image_shape=(16, 16, 16))
+
+    # extent along each axis is limited by that axis' dimension
+    assert mask.sum() == 3 * 7 * 11
+    assert torch.sum(mask.sum(dim=(1, 2)) > 0) == 3
+    assert torch.sum(mask.sum(dim=(0, 2)) > 0) == 7
+    assert torch.sum(mask.sum(dim=(0, 1)) > 0) == 11